@@ -5,6 +5,7 @@ import logging
 import os
 from typing import Any, Optional, Type
 
+import anyio
 from langchain_core.messages import (
 	AIMessage,
 	BaseMessage,
@@ -87,42 +88,42 @@ def _merge_successive_messages(messages: list[BaseMessage], class_to_merge: Type
 	return merged_messages
 
 
-def save_conversation(input_messages: list[BaseMessage], response: Any, target: str, encoding: Optional[str] = None) -> None:
+async def save_conversation(
+	input_messages: list[BaseMessage], response: Any, target: str, encoding: Optional[str] = None
+) -> None:
 	"""Save conversation history to file."""
 
 	# create folders if not exists
 	if dirname := os.path.dirname(target):
 		os.makedirs(dirname, exist_ok=True)
 
-	with open(
-		target,
-		'w',
-		encoding=encoding,
-	) as f:
-		_write_messages_to_file(f, input_messages)
-		_write_response_to_file(f, response)
+	# format in memory and hand the file write to a worker thread so the event loop is not blocked
+	content = _format_messages(input_messages) + _format_response(response)
+	async with await anyio.open_file(target, 'w', encoding=encoding) as f:
+		await f.write(content)
 
 
-def _write_messages_to_file(f: Any, messages: list[BaseMessage]) -> None:
-	"""Write messages to conversation file"""
+def _format_messages(messages: list[BaseMessage]) -> str:
+	"""Format messages for the conversation file"""
+	lines = []
 	for message in messages:
-		f.write(f' {message.__class__.__name__} \n')
+		lines.append(f' {message.__class__.__name__} \n')
 
 		if isinstance(message.content, list):
 			for item in message.content:
 				if isinstance(item, dict) and item.get('type') == 'text':
-					f.write(item['text'].strip() + '\n')
+					lines.append(item['text'].strip() + '\n')
 		elif isinstance(message.content, str):
 			try:
 				content = json.loads(message.content)
-				f.write(json.dumps(content, indent=2) + '\n')
+				lines.append(json.dumps(content, indent=2) + '\n')
 			except json.JSONDecodeError:
-				f.write(message.content.strip() + '\n')
+				lines.append(message.content.strip() + '\n')
 
-		f.write('\n')
+		lines.append('\n')
+	return ''.join(lines)
 
 
-def _write_response_to_file(f: Any, response: Any) -> None:
-	"""Write model response to conversation file"""
-	f.write(' RESPONSE\n')
-	f.write(json.dumps(json.loads(response.model_dump_json(exclude_unset=True)), indent=2))
+def _format_response(response: Any) -> str:
+	"""Format model response for the conversation file"""
+	return ' RESPONSE\n' + json.dumps(json.loads(response.model_dump_json(exclude_unset=True)), indent=2)
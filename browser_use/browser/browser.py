@@ -7,7 +7,6 @@ import gc
 import logging
 import os
 import socket
-import subprocess
 from typing import Literal
 
 import httpx
@@ -129,6 +128,7 @@ class Browser:
 		self.config = config or BrowserConfig()
 		self.playwright: Playwright | None = None
 		self.playwright_browser: PlaywrightBrowser | None = None
+		self._init_task: asyncio.Task[PlaywrightBrowser] | None = None
 
 	async def new_context(self, config: BrowserContextConfig | None = None) -> BrowserContext:
 		"""Create a browser context"""
@@ -140,7 +140,26 @@ class Browser:
 	async def get_playwright_browser(self) -> PlaywrightBrowser:
 		"""Get a browser context"""
 		if self.playwright_browser is None:
-			return await self._init()
+			# share one init task between concurrent callers so playwright is only started once
+			if self._init_task is None:
+				self._init_task = asyncio.create_task(self._init())
+			init_task = self._init_task
+			try:
+				return await asyncio.shield(init_task)
+			except asyncio.CancelledError:
+				if init_task.cancelled():
+					if self._init_task is init_task:
+						self._init_task = None
+					# the shared init was cancelled by close(), not us, so don't pass on a stray cancellation
+					current_task = asyncio.current_task()
+					if not (current_task and current_task.cancelling()):
+						raise RuntimeError('Browser was closed during initialization') from None
+				raise
+			except Exception:
+				# only reset our own task, another caller may already have started a new one
+				if self._init_task is init_task:
+					self._init_task = None
+				raise
 
 		return self.playwright_browser
 
@@ -190,7 +209,7 @@ class Browser:
 			# Check if browser is already running
 			async with httpx.AsyncClient() as client:
 				response = await client.get('http://localhost:9222/json/version', timeout=2)
-				if response.status == 200:
+				if response.status_code == 200:
 					logger.info('🔌  Reusing existing browser found running on http://localhost:9222')
 					browser_class = getattr(playwright, self.config.browser_class)
 					browser = await browser_class.connect_over_cdp(
@@ -213,21 +232,19 @@ class Browser:
 				*self.config.extra_browser_args,
 			},
 		]
-		self._chrome_subprocess = psutil.Process(
-			await asyncio.create_subprocess_shell(
-				chrome_launch_cmd,
-				stdout=subprocess.DEVNULL,
-				stderr=subprocess.DEVNULL,
-				shell=False,
-			).pid
+		chrome_proc = await asyncio.create_subprocess_exec(
+			*chrome_launch_cmd,
+			stdout=asyncio.subprocess.DEVNULL,
+			stderr=asyncio.subprocess.DEVNULL,
 		)
+		self._chrome_subprocess = psutil.Process(chrome_proc.pid)
 
 		# Attempt to connect again after starting a new instance
 		for _ in range(10):
 			try:
 				async with httpx.AsyncClient() as client:
 					response = await client.get('http://localhost:9222/json/version', timeout=2)
-					if response.status == 200:
+					if response.status_code == 200:
 						break
 			except httpx.RequestError:
 				pass
@@ -326,12 +343,25 @@ class Browser:
 			return
 
 		try:
+			# cancel a pending init so it can't attach a new playwright/browser to us after teardown,
+			# whatever it already started is assigned to self and cleaned up below
+			if self._init_task is not None and not self._init_task.done():
+				self._init_task.cancel()
+				# wait without raising the init's cancellation, while close() itself can still be cancelled
+				await asyncio.wait({self._init_task})
+
+			# close the browser before stopping playwright, stopping the driver kills chrome mid-close
 			if self.playwright_browser:
-				await self.playwright_browser.close()
-				del self.playwright_browser
+				try:
+					await self.playwright_browser.close()
+				except Exception as e:
+					logger.debug(f'Failed to close playwright browser properly: {e}')
 			if self.playwright:
-				await self.playwright.stop()
-				del self.playwright
+				try:
+					await self.playwright.stop()
+				except Exception as e:
+					logger.debug(f'Failed to stop playwright properly: {e}')
+
 			if chrome_proc := getattr(self, '_chrome_subprocess', None):
 				try:
 					# always kill all children processes, otherwise chrome leaves a bunch of zombie processes
@@ -350,6 +380,7 @@ class Browser:
 		finally:
 			self.playwright_browser = None
 			self.playwright = None
+			self._init_task = None
 			self._chrome_subprocess = None
 			gc.collect()
 
@@ -4,6 +4,7 @@ Playwright browser on steroids.
 
 import asyncio
 import base64
+import functools
 import gc
 import json
 import logging
@@ -13,6 +14,7 @@ import time
 import uuid
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional
+from urllib.parse import urlparse
 
 import anyio
 from patchright._impl._errors import TimeoutError
@@ -43,6 +45,80 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Expanded set of safe attributes that are stable and useful for selection
+SAFE_ATTRIBUTES = frozenset(
+	{
+		# Data attributes (if they're stable in your application)
+		'id',
+		# Standard HTML attributes
+		'name',
+		'type',
+		'placeholder',
+		# Accessibility attributes
+		'aria-label',
+		'aria-labelledby',
+		'aria-describedby',
+		'role',
+		# Common form attributes
+		'for',
+		'autocomplete',
+		'required',
+		'readonly',
+		# Media attributes
+		'alt',
+		'title',
+		'src',
+		# Custom stable attributes (add any application-specific ones)
+		'href',
+		'target',
+	}
+)
+
+# Test-id style attributes, only used in selectors when include_dynamic_attributes is set
+DYNAMIC_ATTRIBUTES = frozenset(
+	{
+		'data-id',
+		'data-qa',
+		'data-cy',
+		'data-testid',
+	}
+)
+
+SAFE_AND_DYNAMIC_ATTRIBUTES = SAFE_ATTRIBUTES | DYNAMIC_ATTRIBUTES
+
+# Regex pattern for valid class names in CSS
+VALID_CLASS_NAME_PATTERN = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_-]*$')
+
+# marks a trie node where a complete allowed domain ends (labels are always str, so None can't collide)
+_DOMAIN_END = None
+
+
+@functools.lru_cache(maxsize=32)
+def _allowed_domains_trie(allowed_domains: tuple[str, ...]) -> dict:
+	"""Build a trie of the allowed domains keyed on their reversed labels, e.g. example.com -> {'com': {'example': {None: True}}}"""
+	trie: dict = {}
+	for allowed_domain in allowed_domains:
+		node = trie
+		for label in reversed(allowed_domain.lower().split('.')):
+			node = node.setdefault(label, {})
+		node[_DOMAIN_END] = True
+	return trie
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_domain_in_allowed_domains(domain: str, allowed_domains: tuple[str, ...]) -> bool:
+	"""Cached allowlist check keyed on the hostname, the same hosts get checked over and over again on navigation, clicks and tab switches"""
+	# Walk the trie from the top-level label down, the first complete allowed domain we reach
+	# matches either the domain itself or one of its subdomains
+	node = _allowed_domains_trie(allowed_domains)
+	for label in reversed(domain.split('.')):
+		node = node.get(label)
+		if node is None:
+			return False
+		if _DOMAIN_END in node:
+			return True
+	return False
+
 
 class BrowserContextWindowSize(BaseModel):
 	"""Window size configuration for browser context"""
@@ -281,10 +357,10 @@ class BrowserContext:
 		# Initialize these as None - they'll be set up when needed
 		self.session: BrowserSession | None = None
 		self.active_tab: Page | None = None
+		self._session_init_task: asyncio.Task[BrowserSession] | None = None
 
 	async def __aenter__(self):
-		"""Async context manager entry"""
-		await self._initialize_session()
+		"""Async context manager entry, the session is only initialized on first use (see get_session)"""
 		return self
 
 	async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -296,6 +372,15 @@ class BrowserContext:
 		"""Close the browser instance"""
 
 		try:
+			# let a pending session init finish so the context it creates is closed below instead of leaking
+			if (init_task := self._session_init_task) is not None and not init_task.done():
+				# asyncio.wait doesn't raise the init's error or cancellation, a cancelled init is treated like a failed one
+				await asyncio.wait({init_task})
+				if init_task.cancelled():
+					logger.debug('Pending browser session init was cancelled during close')
+				elif e := init_task.exception():
+					logger.debug(f'Pending browser session init failed during close: {e}')
+
 			if self.session is None:
 				return
 
@@ -308,13 +393,15 @@ class BrowserContext:
 					logger.debug(f'Failed to remove CDP listener: {e}')
 				self._page_event_handler = None
 
-			await self.save_cookies()
-
+			# save cookies and stop tracing concurrently, both only need the context to still be open
+			shutdowns = [self.save_cookies()]
 			if self.config.trace_path:
-				try:
-					await self.session.context.tracing.stop(path=os.path.join(self.config.trace_path, f'{self.context_id}.zip'))
-				except Exception as e:
-					logger.debug(f'Failed to stop tracing: {e}')
+				shutdowns.append(
+					self.session.context.tracing.stop(path=os.path.join(self.config.trace_path, f'{self.context_id}.zip'))
+				)
+			for result in await asyncio.gather(*shutdowns, return_exceptions=True):
+				if isinstance(result, Exception):
+					logger.debug(f'Failed to stop tracing: {result}')
 
 			# This is crucial - it closes the CDP connection
 			if not self.config.keep_alive:
@@ -328,6 +415,7 @@ class BrowserContext:
 			# Dereference everything
 			self.active_tab = None
 			self.session = None
+			self._session_init_task = None
 			self._page_event_handler = None
 
 	def __del__(self):
@@ -426,9 +514,16 @@ class BrowserContext:
 	async def get_session(self) -> BrowserSession:
 		"""Lazy initialization of the browser and related components"""
 		if self.session is None:
+			# share one init task between concurrent callers so only one playwright context gets created
+			if self._session_init_task is None:
+				self._session_init_task = asyncio.create_task(self._initialize_session())
+			init_task = self._session_init_task
 			try:
-				return await self._initialize_session()
+				return await asyncio.shield(init_task)
 			except Exception as e:
+				# only reset our own task, another caller may already have started a new one
+				if self._session_init_task is init_task:
+					self._session_init_task = None
 				logger.error(f'❌  Failed to create new browser session: {e} (did the browser process quit?)')
 				raise e
 		return self.session
@@ -715,24 +810,16 @@ class BrowserContext:
 			return True
 
 		try:
-			from urllib.parse import urlparse
-
-			parsed_url = urlparse(url)
-			domain = parsed_url.netloc.lower()
-
 			# Special case: Allow 'about:blank' explicitly
 			if url == 'about:blank':
 				return True
 
-			# Remove port number if present
-			if ':' in domain:
-				domain = domain.split(':')[0]
+			# hostname is already lowercased and stripped of any port or credentials
+			domain = urlparse(url).hostname
+			if not domain:
+				return False
 
-			# Check if domain matches any allowed domain pattern
-			return any(
-				domain == allowed_domain.lower() or domain.endswith('.' + allowed_domain.lower())
-				for allowed_domain in self.config.allowed_domains
-			)
+			return _is_domain_in_allowed_domains(domain, tuple(self.config.allowed_domains))
 		except Exception as e:
 			logger.error(f'⛔️  Error checking URL allowlist: {str(e)}')
 			return False
@@ -1049,8 +1136,9 @@ class BrowserContext:
 	# region - User Actions
 
 	@classmethod
+	@functools.lru_cache(maxsize=4096)
 	def _convert_simple_xpath_to_css_selector(cls, xpath: str) -> str:
-		"""Converts simple XPath expressions to CSS selectors."""
+		"""Converts simple XPath expressions to CSS selectors (cached, the same xpaths get converted on every state update)."""
 		if not xpath:
 			return ''
 
@@ -1118,102 +1206,77 @@ class BrowserContext:
 		        A valid CSS selector string
 		"""
 		try:
-			# Get base selector from XPath
-			css_selector = cls._convert_simple_xpath_to_css_selector(element.xpath)
-
-			# Handle class attributes
-			if 'class' in element.attributes and element.attributes['class'] and include_dynamic_attributes:
-				# Define a regex pattern for valid class names in CSS
-				valid_class_name_pattern = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_-]*$')
-
-				# Iterate through the class attribute values
-				classes = element.attributes['class'].split()
-				for class_name in classes:
-					# Skip empty class names
-					if not class_name.strip():
-						continue
-
-					# Check if the class name is valid
-					if valid_class_name_pattern.match(class_name):
-						# Append the valid class name to the CSS selector
-						css_selector += f'.{class_name}'
-					else:
-						# Skip invalid class names
-						continue
-
-			# Expanded set of safe attributes that are stable and useful for selection
-			SAFE_ATTRIBUTES = {
-				# Data attributes (if they're stable in your application)
-				'id',
-				# Standard HTML attributes
-				'name',
-				'type',
-				'placeholder',
-				# Accessibility attributes
-				'aria-label',
-				'aria-labelledby',
-				'aria-describedby',
-				'role',
-				# Common form attributes
-				'for',
-				'autocomplete',
-				'required',
-				'readonly',
-				# Media attributes
-				'alt',
-				'title',
-				'src',
-				# Custom stable attributes (add any application-specific ones)
-				'href',
-				'target',
-			}
+			return cls._css_selector_for_xpath_and_attributes(
+				element.xpath, tuple(element.attributes.items()), include_dynamic_attributes
+			)
 
-			if include_dynamic_attributes:
-				dynamic_attributes = {
-					'data-id',
-					'data-qa',
-					'data-cy',
-					'data-testid',
-				}
-				SAFE_ATTRIBUTES.update(dynamic_attributes)
+		except Exception:
+			# Fallback to a more basic selector if something goes wrong
+			tag_name = element.tag_name or '*'
+			return f"{tag_name}[highlight_index='{element.highlight_index}']"
 
-			# Handle other attributes
-			for attribute, value in element.attributes.items():
-				if attribute == 'class':
+	@classmethod
+	@functools.lru_cache(maxsize=8192)
+	def _css_selector_for_xpath_and_attributes(
+		cls, xpath: str, attribute_items: tuple[tuple[str, str], ...], include_dynamic_attributes: bool
+	) -> str:
+		"""Cached selector construction, elements keep the same xpath and attributes across state updates"""
+		attributes = dict(attribute_items)
+
+		# Get base selector from XPath
+		css_selector = cls._convert_simple_xpath_to_css_selector(xpath)
+
+		# Handle class attributes
+		if 'class' in attributes and attributes['class'] and include_dynamic_attributes:
+			# Iterate through the class attribute values
+			classes = attributes['class'].split()
+			for class_name in classes:
+				# Skip empty class names
+				if not class_name.strip():
 					continue
 
-				# Skip invalid attribute names
-				if not attribute.strip():
+				# Check if the class name is valid
+				if VALID_CLASS_NAME_PATTERN.match(class_name):
+					# Append the valid class name to the CSS selector
+					css_selector += f'.{class_name}'
+				else:
+					# Skip invalid class names
 					continue
 
-				if attribute not in SAFE_ATTRIBUTES:
-					continue
+		safe_attributes = SAFE_AND_DYNAMIC_ATTRIBUTES if include_dynamic_attributes else SAFE_ATTRIBUTES
 
-				# Escape special characters in attribute names
-				safe_attribute = attribute.replace(':', r'\:')
-
-				# Handle different value cases
-				if value == '':
-					css_selector += f'[{safe_attribute}]'
-				elif any(char in value for char in '"\'<>`\n\r\t'):
-					# Use contains for values with special characters
-					# For newline-containing text, only use the part before the newline
-					if '\n' in value:
-						value = value.split('\n')[0]
-					# Regex-substitute *any* whitespace with a single space, then strip.
-					collapsed_value = re.sub(r'\s+', ' ', value).strip()
-					# Escape embedded double-quotes.
-					safe_value = collapsed_value.replace('"', '\\"')
-					css_selector += f'[{safe_attribute}*="{safe_value}"]'
-				else:
-					css_selector += f'[{safe_attribute}="{value}"]'
+		# Handle other attributes
+		for attribute, value in attributes.items():
+			if attribute == 'class':
+				continue
 
-			return css_selector
+			# Skip invalid attribute names
+			if not attribute.strip():
+				continue
 
-		except Exception:
-			# Fallback to a more basic selector if something goes wrong
-			tag_name = element.tag_name or '*'
-			return f"{tag_name}[highlight_index='{element.highlight_index}']"
+			if attribute not in safe_attributes:
+				continue
+
+			# Escape special characters in attribute names
+			safe_attribute = attribute.replace(':', r'\:')
+
+			# Handle different value cases
+			if value == '':
+				css_selector += f'[{safe_attribute}]'
+			elif any(char in value for char in '"\'<>`\n\r\t'):
+				# Use contains for values with special characters
+				# For newline-containing text, only use the part before the newline
+				if '\n' in value:
+					value = value.split('\n')[0]
+				# Regex-substitute *any* whitespace with a single space, then strip.
+				collapsed_value = re.sub(r'\s+', ' ', value).strip()
+				# Escape embedded double-quotes.
+				safe_value = collapsed_value.replace('"', '\\"')
+				css_selector += f'[{safe_attribute}*="{safe_value}"]'
+			else:
+				css_selector += f'[{safe_attribute}="{value}"]'
+
+		return css_selector
 
 	@time_execution_async('--get_locate_element')
 	async def get_locate_element(self, element: DOMElementNode) -> Optional[ElementHandle]:
@@ -1585,28 +1648,19 @@ class BrowserContext:
 
 	async def is_file_uploader(self, element_node: DOMElementNode, max_depth: int = 3, current_depth: int = 0) -> bool:
 		"""Check if element or its children are file uploaders"""
-		if current_depth > max_depth:
-			return False
-
-		# Check current element
-		is_uploader = False
-
-		if not isinstance(element_node, DOMElementNode):
-			return False
-
-		# Check for file input attributes
-		if element_node.tag_name == 'input':
-			is_uploader = element_node.attributes.get('type') == 'file' or element_node.attributes.get('accept') is not None
+		# explicit (node, depth) stack instead of awaiting a recursive call per child
+		stack = [(element_node, current_depth)]
+		while stack:
+			node, depth = stack.pop()
+			if depth > max_depth or not isinstance(node, DOMElementNode):
+				continue
 
-		if is_uploader:
-			return True
+			# Check for file input attributes
+			if node.tag_name == 'input' and (node.attributes.get('type') == 'file' or node.attributes.get('accept') is not None):
+				return True
 
-		# Recursively check children
-		if element_node.children and current_depth < max_depth:
-			for child in element_node.children:
-				if isinstance(child, DOMElementNode):
-					if await self.is_file_uploader(child, max_depth, current_depth + 1):
-						return True
+			if depth < max_depth:
+				stack.extend((child, depth + 1) for child in node.children)
 
 		return False
 
@@ -1626,9 +1680,10 @@ class BrowserContext:
 		# close all tabs and clear cached state
 		session = await self.get_session()
 
-		pages = session.context.pages
-		for page in pages:
-			await page.close()
+		# close all tabs concurrently, a tab that fails to close must not keep the others open
+		for result in await asyncio.gather(*(page.close() for page in session.context.pages), return_exceptions=True):
+			if isinstance(result, Exception):
+				logger.debug(f'Failed to close tab: {result}')
 
 		self.active_tab = None
 		session.cached_state = None
@@ -1,4 +1,6 @@
 import asyncio
+import contextvars
+import functools
 from inspect import iscoroutinefunction, signature
 from typing import Any, Callable, Dict, Generic, Optional, Type, TypeVar
 
@@ -21,6 +23,15 @@ from browser_use.utils import time_execution_async
 Context = TypeVar('Context')
 
 
+async def _run_in_thread(func: Callable, /, *args, **kwargs) -> Any:
+	"""Like asyncio.to_thread, but skips the contextvars copy/run wrapper when no context vars are set"""
+	loop = asyncio.get_running_loop()
+	ctx = contextvars.copy_context()
+	if not ctx:
+		return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+	return await loop.run_in_executor(None, functools.partial(ctx.run, func, *args, **kwargs))
+
+
 class Registry(Generic[Context]):
 	"""Service for registering and managing actions"""
 
@@ -66,7 +77,7 @@ class Registry(Generic[Context]):
 			if not iscoroutinefunction(func):
 
 				async def async_wrapper(*args, **kwargs):
-					return await asyncio.to_thread(func, *args, **kwargs)
+					return await _run_in_thread(func, *args, **kwargs)
 
 				# Copy the signature and other metadata from the original function
 				async_wrapper.__signature__ = signature(func)
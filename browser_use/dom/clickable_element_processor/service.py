@@ -14,14 +14,17 @@ class ClickableElementProcessor:
 	def get_clickable_elements(dom_element: DOMElementNode) -> list[DOMElementNode]:
 		"""Get all clickable elements in the DOM tree"""
 		clickable_elements = list()
-		for child in dom_element.children:
+		# explicit stack instead of recursion, children pushed in reverse to keep document (pre-)order
+		stack = list(reversed(dom_element.children))
+		while stack:
+			child = stack.pop()
 			if isinstance(child, DOMElementNode):
 				if child.highlight_index:
 					clickable_elements.append(child)
 
-				clickable_elements.extend(ClickableElementProcessor.get_clickable_elements(child))
+				stack.extend(reversed(child.children))
 
-		return list(clickable_elements)
+		return clickable_elements
 
 	@staticmethod
 	def hash_dom_element(dom_element: DOMElementNode) -> str:
@@ -23,6 +23,7 @@ logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 
+import browser_use.browser.browser as browser_module
 from browser_use.browser.browser import Browser, BrowserConfig
 from browser_use.browser.context import BrowserContext
 
@@ -57,3 +58,16 @@ async def browser_context(browser):
 	context = BrowserContext(browser=browser)
 	yield context
 	await context.close()
+
+
+@pytest.fixture
+def patch_playwright(monkeypatch):
+	"""
+	Fixture to swap browser_use.browser.browser.async_playwright for a test factory.
+	Patches the module attribute directly instead of resolving a dotted path string on every test.
+	"""
+
+	def _patch(factory):
+		monkeypatch.setattr(browser_module, 'async_playwright', factory)
+
+	return _patch
@@ -1,6 +1,5 @@
 from unittest.mock import MagicMock
 
-import pytest
 from patchright.async_api import Page
 from pydantic import BaseModel
 
@@ -213,7 +212,6 @@ class TestActionFilters:
 		assert 'both_matching' not in description  # Page filter fails
 		assert 'both_one_fail' not in description  # Domain filter fails
 
-	@pytest.mark.asyncio
 	async def test_registry_action_decorator(self):
 		"""Test the action decorator with filters"""
 		registry = Registry()
@@ -247,7 +245,6 @@ class TestActionFilters:
 		assert 'Domain filter action' in page_description
 		assert 'Page filter action' in page_description
 
-	@pytest.mark.asyncio
 	async def test_action_model_creation(self):
 		"""Test that action models are created correctly with filters"""
 		registry = Registry()
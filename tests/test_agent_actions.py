@@ -1,4 +1,3 @@
-import asyncio
 import os
 
 import pytest
@@ -26,15 +25,7 @@ def llm():
 
 
 @pytest.fixture(scope='session')
-def event_loop():
-	"""Create an instance of the default event loop for each test case."""
-	loop = asyncio.get_event_loop_policy().new_event_loop()
-	yield loop
-	loop.close()
-
-
-@pytest.fixture(scope='session')
-async def browser(event_loop):
+async def browser():
 	browser_instance = Browser(
 		config=BrowserConfig(
 			headless=True,
@@ -163,7 +154,6 @@ class CaptchaTest(BaseModel):
 
 # run 3 test: python -m pytest tests/test_agent_actions.py -v -k "test_captcha_solver" --capture=no --log-cli-level=INFO
 # pytest tests/test_agent_actions.py -v -k "test_captcha_solver" --capture=no --log-cli-level=INFO
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
 	'captcha',
 	[
@@ -198,7 +188,6 @@ async def test_captcha_solver(llm, context, captcha: CaptchaTest):
 		llm=llm,
 		browser_context=context,
 	)
-	from browser_use.agent.views import AgentHistoryList
 
 	history: AgentHistoryList = await agent.run(max_steps=7)
 
@@ -1,281 +1,181 @@
 import asyncio
-import subprocess
+from unittest.mock import AsyncMock, MagicMock
 
+import httpx
+import psutil
 import pytest
-import requests
 
 from browser_use.browser.browser import Browser, BrowserConfig, ProxySettings
+from browser_use.browser.chrome import CHROME_ARGS, CHROME_DISABLE_SECURITY_ARGS, CHROME_HEADLESS_ARGS
 from browser_use.browser.context import BrowserContext, BrowserContextConfig
 
+# Base arguments for a headless builtin launch; the debugging port is left out as it is dropped when 9222 is already taken.
+HEADLESS_BASE_ARGS = frozenset(
+	{*CHROME_ARGS, *CHROME_HEADLESS_ARGS, '--window-position=0,0', '--window-size=1920,1080'} - {'--remote-debugging-port=9222'}
+)
 
-@pytest.mark.asyncio
-async def test_builtin_browser_launch(monkeypatch):
+
+def mock_async_playwright(playwright_browser=None, connect_error=None):
 	"""
-	Test that the standard browser is launched correctly:
-	When no remote (cdp or wss) or chrome instance is provided, the Browser class uses _setup_builtin_browser.
-	This test monkeypatches async_playwright to return dummy objects, and asserts that get_playwright_browser returns the expected DummyBrowser.
+	Build an async_playwright() replacement whose chromium launch/connect methods are AsyncMocks returning
+	playwright_browser (or raising connect_error). Returns the mocked playwright and the factory to pass to patch_playwright.
 	"""
-
-	class DummyBrowser:
-		pass
-
-	class DummyChromium:
-		async def launch(self, headless, args, proxy=None, handle_sigterm=False, handle_sigint=False):
-			return DummyBrowser()
-
-	class DummyPlaywright:
-		def __init__(self):
-			self.chromium = DummyChromium()
-
-		async def stop(self):
-			pass
-
-	class DummyAsyncPlaywrightContext:
-		async def start(self):
-			return DummyPlaywright()
-
-	monkeypatch.setattr('browser_use.browser.browser.async_playwright', lambda: DummyAsyncPlaywrightContext())
-	config = BrowserConfig(headless=True, disable_security=False, extra_browser_args=['--test'])
-	browser_obj = Browser(config=config)
-	result_browser = await browser_obj.get_playwright_browser()
-	assert isinstance(result_browser, DummyBrowser), 'Expected DummyBrowser from _setup_builtin_browser'
-	await browser_obj.close()
+	playwright = MagicMock()
+	playwright.stop = AsyncMock()
+	for method in ('launch', 'connect', 'connect_over_cdp'):
+		setattr(playwright.chromium, method, AsyncMock(return_value=playwright_browser, side_effect=connect_error))
+	context_manager = MagicMock()
+	context_manager.start = AsyncMock(return_value=playwright)
+	return playwright, lambda: context_manager
 
 
-@pytest.mark.asyncio
-async def test_cdp_browser_launch(monkeypatch):
+@pytest.fixture(scope='module')
+def default_browser():
 	"""
-	Test that when a CDP URL is provided in the configuration, the Browser uses _setup_cdp
-	and returns the expected DummyBrowser.
+	Browser with the default config, shared by the tests that only inspect it and never launch it.
 	"""
+	return Browser(config=BrowserConfig())
 
-	class DummyBrowser:
-		pass
-
-	class DummyChromium:
-		async def connect_over_cdp(self, endpoint_url, timeout=20000):
-			assert endpoint_url == 'ws://dummy-cdp-url', 'The endpoint URL should match the configuration.'
-			return DummyBrowser()
-
-	class DummyPlaywright:
-		def __init__(self):
-			self.chromium = DummyChromium()
-
-		async def stop(self):
-			pass
-
-	class DummyAsyncPlaywrightContext:
-		async def start(self):
-			return DummyPlaywright()
 
-	monkeypatch.setattr('browser_use.browser.browser.async_playwright', lambda: DummyAsyncPlaywrightContext())
-	config = BrowserConfig(cdp_url='ws://dummy-cdp-url')
+async def test_builtin_browser_launch(patch_playwright):
+	"""
+	Test that the standard browser is launched correctly:
+	When no remote (cdp or wss) or chrome instance is provided, the Browser class uses _setup_builtin_browser.
+	This test patches async_playwright with mocks, and asserts that get_playwright_browser returns the mocked browser.
+	"""
+	dummy_browser = AsyncMock()
+	playwright, factory = mock_async_playwright(dummy_browser)
+	patch_playwright(factory)
+	config = BrowserConfig(headless=True, disable_security=False, extra_browser_args=['--test'])
 	browser_obj = Browser(config=config)
 	result_browser = await browser_obj.get_playwright_browser()
-	assert isinstance(result_browser, DummyBrowser), 'Expected DummyBrowser from _setup_cdp'
+	assert result_browser is dummy_browser, 'Expected the mocked browser from _setup_builtin_browser'
+	playwright.chromium.launch.assert_awaited_once()
 	await browser_obj.close()
 
 
-@pytest.mark.asyncio
-async def test_wss_browser_launch(monkeypatch):
+@pytest.mark.parametrize(
+	'config_kwargs, expected_method, expected_url',
+	[
+		({'cdp_url': 'ws://dummy-cdp-url'}, 'connect_over_cdp', 'ws://dummy-cdp-url'),
+		({'wss_url': 'ws://dummy-wss-url'}, 'connect', 'ws://dummy-wss-url'),
+	],
+	ids=['cdp', 'wss'],
+)
+async def test_remote_browser_launch(patch_playwright, config_kwargs, expected_method, expected_url):
 	"""
-	Test that when a WSS URL is provided in the configuration,
-	the Browser uses setup_wss and returns the expected DummyBrowser.
+	Test that when a CDP or WSS URL is provided in the configuration, the Browser connects to the
+	remote browser (_setup_remote_cdp_browser / _setup_remote_wss_browser) and returns the mocked browser.
 	"""
-
-	class DummyBrowser:
-		pass
-
-	class DummyChromium:
-		async def connect(self, wss_url):
-			assert wss_url == 'ws://dummy-wss-url', 'WSS URL should match the configuration.'
-			return DummyBrowser()
-
-	class DummyPlaywright:
-		def __init__(self):
-			self.chromium = DummyChromium()
-
-		async def stop(self):
-			pass
-
-	class DummyAsyncPlaywrightContext:
-		async def start(self):
-			return DummyPlaywright()
-
-	monkeypatch.setattr('browser_use.browser.browser.async_playwright', lambda: DummyAsyncPlaywrightContext())
-	config = BrowserConfig(wss_url='ws://dummy-wss-url')
+	dummy_browser = AsyncMock()
+	playwright, factory = mock_async_playwright(dummy_browser)
+	patch_playwright(factory)
+	config = BrowserConfig(**config_kwargs)
 	browser_obj = Browser(config=config)
 	result_browser = await browser_obj.get_playwright_browser()
-	assert isinstance(result_browser, DummyBrowser), 'Expected DummyBrowser from _setup_wss'
+	assert result_browser is dummy_browser, f'Expected the mocked browser from {expected_method}'
+	connect = getattr(playwright.chromium, expected_method)
+	connect.assert_awaited_once()
+	assert connect.call_args.args[0] == expected_url, 'The endpoint URL should match the configuration.'
+	playwright.chromium.launch.assert_not_awaited()
 	await browser_obj.close()
 
 
-@pytest.mark.asyncio
-async def test_user_provided_browser_launch(monkeypatch):
+async def test_user_provided_browser_launch(monkeypatch, patch_playwright):
 	"""
 	Test that when a browser_binary_path is provided the Browser class uses
-	_setup_user_provided_browser branch and returns the expected DummyBrowser object
+	_setup_user_provided_browser branch and returns the mocked browser
 	by reusing an existing Chrome instance.
 	"""
 
-	# Dummy response for requests.get when checking chrome debugging endpoint.
+	# Dummy response for httpx.AsyncClient.get when checking chrome debugging endpoint.
 	class DummyResponse:
 		status_code = 200
 
-	def dummy_get(url, timeout):
+	async def dummy_get(self, url, timeout=None):
 		if url == 'http://localhost:9222/json/version':
 			return DummyResponse()
-		raise requests.ConnectionError('Connection failed')
+		raise httpx.ConnectError('Connection failed')
 
-	monkeypatch.setattr(requests, 'get', dummy_get)
+	monkeypatch.setattr(httpx.AsyncClient, 'get', dummy_get)
 
-	class DummyBrowser:
-		pass
-
-	class DummyChromium:
-		async def connect_over_cdp(self, endpoint_url, timeout=20000):
-			assert endpoint_url == 'http://localhost:9222', "Endpoint URL must be 'http://localhost:9222'"
-			return DummyBrowser()
-
-	class DummyPlaywright:
-		def __init__(self):
-			self.chromium = DummyChromium()
-
-		async def stop(self):
-			pass
-
-	class DummyAsyncPlaywrightContext:
-		async def start(self):
-			return DummyPlaywright()
-
-	monkeypatch.setattr('browser_use.browser.browser.async_playwright', lambda: DummyAsyncPlaywrightContext())
+	dummy_browser = AsyncMock()
+	playwright, factory = mock_async_playwright(dummy_browser)
+	patch_playwright(factory)
 	config = BrowserConfig(browser_binary_path='dummy/chrome', extra_browser_args=['--dummy-arg'])
 	browser_obj = Browser(config=config)
 	result_browser = await browser_obj.get_playwright_browser()
-	assert isinstance(result_browser, DummyBrowser), 'Expected DummyBrowser from _setup_user_provided_browser'
+	assert result_browser is dummy_browser, 'Expected the mocked browser from _setup_user_provided_browser'
+	endpoint_url = playwright.chromium.connect_over_cdp.call_args.kwargs['endpoint_url']
+	assert endpoint_url == 'http://localhost:9222', "Endpoint URL must be 'http://localhost:9222'"
 	await browser_obj.close()
 
 
-@pytest.mark.asyncio
-async def test_builtin_browser_disable_security_args(monkeypatch):
-	"""
-	Test that the standard browser launch includes disable-security arguments when disable_security is True.
-	This verifies that _setup_builtin_browser correctly appends the security disabling arguments along with
-	the base arguments and any extra arguments provided.
-	"""
-	# These are the base arguments defined in _setup_builtin_browser.
-	base_args = [
-		'--no-sandbox',
-		'--disable-blink-features=AutomationControlled',
-		'--disable-infobars',
-		'--disable-background-timer-throttling',
-		'--disable-popup-blocking',
-		'--disable-backgrounding-occluded-windows',
-		'--disable-renderer-backgrounding',
-		'--disable-window-activation',
-		'--disable-focus-on-load',
-		'--no-first-run',
-		'--no-default-browser-check',
-		'--no-startup-window',
-		'--window-position=0,0',
-	]
-	# When disable_security is True, these arguments should be added.
-	disable_security_args = [
-		'--disable-web-security',
-		'--disable-site-isolation-trials',
-		'--disable-features=IsolateOrigins,site-per-process',
-	]
-	# Additional arbitrary argument for testing extra args
-	extra_args = ['--dummy-extra']
-
-	class DummyBrowser:
-		pass
-
-	class DummyChromium:
-		async def launch(self, headless, args, proxy=None, handle_sigterm=False, handle_sigint=False):
-			# Expected args is the base args plus disable security args and the extra args.
-			expected_args = base_args + disable_security_args + extra_args
-			assert headless is True, 'Expected headless to be True'
-			assert args == expected_args, f'Expected args {expected_args}, but got {args}'
-			assert proxy is None, 'Expected proxy to be None'
-			return DummyBrowser()
-
-	class DummyPlaywright:
-		def __init__(self):
-			self.chromium = DummyChromium()
-
-		async def stop(self):
-			pass
-
-	class DummyAsyncPlaywrightContext:
-		async def start(self):
-			return DummyPlaywright()
-
-	monkeypatch.setattr('browser_use.browser.browser.async_playwright', lambda: DummyAsyncPlaywrightContext())
-	config = BrowserConfig(headless=True, disable_security=True, extra_browser_args=extra_args)
+@pytest.mark.parametrize(
+	'disable_security, extra_args, expected_args',
+	[
+		(True, [], CHROME_DISABLE_SECURITY_ARGS),
+		(False, [], []),
+		(True, ['--dummy-extra'], [*CHROME_DISABLE_SECURITY_ARGS, '--dummy-extra']),
+		(False, ['--custom-arg'], ['--custom-arg']),
+	],
+	ids=['disable_security', 'default', 'disable_security_with_extra_args', 'extra_args'],
+)
+async def test_builtin_browser_launch_args(patch_playwright, disable_security, extra_args, expected_args):
+	"""
+	Test that _setup_builtin_browser launches with the base chrome arguments, plus the disable-security
+	arguments only when disable_security is True, plus any extra arguments provided.
+	"""
+	playwright, factory = mock_async_playwright(AsyncMock())
+	patch_playwright(factory)
+	config = BrowserConfig(headless=True, disable_security=disable_security, extra_browser_args=extra_args)
 	browser_obj = Browser(config=config)
-	result_browser = await browser_obj.get_playwright_browser()
-	assert isinstance(result_browser, DummyBrowser), (
-		'Expected DummyBrowser from _setup_builtin_browser with disable_security active'
-	)
+	await browser_obj.get_playwright_browser()
+
+	launch_kwargs = playwright.chromium.launch.call_args.kwargs
+	assert launch_kwargs['headless'] is True, 'Expected headless to be True'
+	assert launch_kwargs['proxy'] is None, 'Expected proxy to be None'
+	launch_args = set(launch_kwargs['args'])
+	missing_args = HEADLESS_BASE_ARGS.union(expected_args) - launch_args
+	assert not missing_args, f'Expected launch args to include {missing_args}'
+	unexpected_args = (set(CHROME_DISABLE_SECURITY_ARGS) - set(expected_args)) & launch_args
+	assert not unexpected_args, f'Expected launch args to exclude {unexpected_args}'
 	await browser_obj.close()
 
 
-@pytest.mark.asyncio
-async def test_new_context_creation():
+async def test_new_context_creation(default_browser):
 	"""
 	Test that the new_context method returns a BrowserContext with the correct attributes.
 	This verifies that the BrowserContext is initialized with the provided Browser instance and configuration.
 	"""
-	config = BrowserConfig()
-	browser_obj = Browser(config=config)
 	custom_context_config = BrowserContextConfig()
-	context = await browser_obj.new_context(custom_context_config)
+	context = await default_browser.new_context(custom_context_config)
 	assert isinstance(context, BrowserContext), 'Expected new_context to return an instance of BrowserContext'
-	assert context.browser is browser_obj, "Expected the context's browser attribute to be the Browser instance"
+	assert context.browser is default_browser, "Expected the context's browser attribute to be the Browser instance"
 	assert context.config == custom_context_config, "Expected the context's config attribute to be the provided config"
-	await browser_obj.close()
 
 
-@pytest.mark.asyncio
-async def test_user_provided_browser_launch_failure(monkeypatch):
+async def test_user_provided_browser_launch_failure(monkeypatch, patch_playwright):
 	"""
 	Test that when a Chrome instance cannot be started or connected to,
 	the Browser._setup_user_provided_browser branch eventually raises a RuntimeError.
 	We simulate failure by:
-	  - Forcing requests.get to always raise a ConnectionError (so no existing instance is found).
-	  - Monkeypatching subprocess.Popen to do nothing.
-	  - Replacing asyncio.sleep to avoid delays.
-	  - Having the dummy playwright's connect_over_cdp method always raise an Exception.
+	  - Forcing httpx.AsyncClient.get to always raise a ConnectError (so no existing instance is found).
+	  - Replacing the chrome subprocess launch and its psutil handle with mocks.
+	  - Replacing asyncio.sleep so the endpoint polling loop does not wait between retries.
+	  - Having the mocked playwright's connect_over_cdp method always raise an Exception.
 	"""
 
-	def dummy_get(url, timeout):
-		raise requests.ConnectionError('Simulated connection failure')
+	async def dummy_get(self, url, timeout=None):
+		raise httpx.ConnectError('Simulated connection failure')
 
-	monkeypatch.setattr(requests, 'get', dummy_get)
-	monkeypatch.setattr(subprocess, 'Popen', lambda args, stdout, stderr: None)
+	monkeypatch.setattr(httpx.AsyncClient, 'get', dummy_get)
+	monkeypatch.setattr(asyncio, 'create_subprocess_exec', AsyncMock(return_value=MagicMock(pid=-1)))
+	monkeypatch.setattr(psutil, 'Process', MagicMock())
+	monkeypatch.setattr(asyncio, 'sleep', AsyncMock())
 
-	async def fake_sleep(seconds):
-		return
-
-	monkeypatch.setattr(asyncio, 'sleep', fake_sleep)
-
-	class DummyChromium:
-		async def connect_over_cdp(self, endpoint_url, timeout=20000):
-			raise Exception('Connection failed simulation')
-
-	class DummyPlaywright:
-		def __init__(self):
-			self.chromium = DummyChromium()
-
-		async def stop(self):
-			pass
-
-	class DummyAsyncPlaywrightContext:
-		async def start(self):
-			return DummyPlaywright()
-
-	monkeypatch.setattr('browser_use.browser.browser.async_playwright', lambda: DummyAsyncPlaywrightContext())
+	_, factory = mock_async_playwright(connect_error=Exception('Connection failed simulation'))
+	patch_playwright(factory)
 	config = BrowserConfig(browser_binary_path='dummy/chrome', extra_browser_args=['--dummy-arg'])
 	browser_obj = Browser(config=config)
 	with pytest.raises(RuntimeError, match='To start chrome in Debug mode'):
@@ -283,113 +183,205 @@ async def test_user_provided_browser_launch_failure(monkeypatch):
 	await browser_obj.close()
 
 
-@pytest.mark.asyncio
-async def test_get_playwright_browser_caching(monkeypatch):
+async def test_get_playwright_browser_caching(patch_playwright):
 	"""
 	Test that get_playwright_browser returns a cached browser instance.
 	On the first call, the browser is initialized; on subsequent calls,
 	the same instance is returned.
 	"""
+	playwright, factory = mock_async_playwright(AsyncMock())
+	patch_playwright(factory)
+	config = BrowserConfig(headless=True, disable_security=False, extra_browser_args=['--test'])
+	browser_obj = Browser(config=config)
+	first_browser = await browser_obj.get_playwright_browser()
+	second_browser = await browser_obj.get_playwright_browser()
+	assert first_browser is second_browser, 'Expected the browser to be cached and reused across calls.'
+	playwright.chromium.launch.assert_awaited_once()
+	await browser_obj.close()
 
-	class DummyBrowser:
-		pass
 
-	class DummyChromium:
-		async def launch(self, headless, args, proxy=None, handle_sigterm=False, handle_sigint=False):
-			return DummyBrowser()
+async def test_get_playwright_browser_concurrent_init(patch_playwright):
+	"""
+	Test that concurrent get_playwright_browser calls share a single initialization,
+	so playwright is started and the browser launched only once.
+	"""
+	dummy_browser = AsyncMock()
+	playwright, factory = mock_async_playwright(dummy_browser)
+	patch_playwright(factory)
+	browser_obj = Browser(config=BrowserConfig(headless=True))
+	results = await asyncio.gather(*(browser_obj.get_playwright_browser() for _ in range(3)))
+	assert all(result is dummy_browser for result in results), 'Expected every caller to get the same browser.'
+	playwright.chromium.launch.assert_awaited_once()
+	await browser_obj.close()
 
-	class DummyPlaywright:
-		def __init__(self):
-			self.chromium = DummyChromium()
 
-		async def stop(self):
-			pass
+async def test_close_cancels_pending_init(patch_playwright):
+	"""
+	Test that close() cancels an in-flight initialization, so it can't attach a browser to the
+	closed instance afterwards, that the already started playwright is still stopped, and that
+	callers waiting on the init get a RuntimeError instead of a stray CancelledError.
+	"""
+	playwright, factory = mock_async_playwright()
+	launched = asyncio.Event()
+
+	async def hanging_launch(**kwargs):
+		launched.set()
+		await asyncio.Event().wait()
+
+	playwright.chromium.launch = AsyncMock(side_effect=hanging_launch)
+	patch_playwright(factory)
+	browser_obj = Browser(config=BrowserConfig(headless=True))
+	init = asyncio.create_task(browser_obj.get_playwright_browser())
+	await launched.wait()
+	await browser_obj.close()
+	with pytest.raises(RuntimeError, match='closed during initialization'):
+		await init
+	playwright.stop.assert_awaited_once()
+	assert browser_obj.playwright is None
+	assert browser_obj.playwright_browser is None
+	assert browser_obj._init_task is None
 
-	class DummyAsyncPlaywrightContext:
-		async def start(self):
-			return DummyPlaywright()
 
-	monkeypatch.setattr('browser_use.browser.browser.async_playwright', lambda: DummyAsyncPlaywrightContext())
-	config = BrowserConfig(headless=True, disable_security=False, extra_browser_args=['--test'])
-	browser_obj = Browser(config=config)
-	first_browser = await browser_obj.get_playwright_browser()
-	second_browser = await browser_obj.get_playwright_browser()
-	assert first_browser is second_browser, 'Expected the browser to be cached and reused across calls.'
+async def test_close_can_be_cancelled_while_waiting_for_init(patch_playwright):
+	"""
+	Test that close() itself stays cancellable while it waits for a cancelled init to unwind.
+	"""
+	playwright, factory = mock_async_playwright()
+	launched = asyncio.Event()
+	unwound = asyncio.Event()
+
+	async def slow_to_unwind_launch(**kwargs):
+		launched.set()
+		try:
+			await asyncio.Event().wait()
+		finally:
+			await unwound.wait()
+
+	playwright.chromium.launch = AsyncMock(side_effect=slow_to_unwind_launch)
+	patch_playwright(factory)
+	browser_obj = Browser(config=BrowserConfig(headless=True))
+	init = asyncio.create_task(browser_obj.get_playwright_browser())
+	await launched.wait()
+	close = asyncio.create_task(browser_obj.close())
+	await asyncio.sleep(0)
+	close.cancel()
+	await asyncio.wait({close}, timeout=1)
+	assert close.cancelled()
+	unwound.set()
+	with pytest.raises(RuntimeError):
+		await init
 	await browser_obj.close()
 
 
-@pytest.mark.asyncio
-async def test_close_error_handling(monkeypatch):
+async def test_get_playwright_browser_failed_waiter_keeps_retried_init(patch_playwright):
 	"""
-	Test that the close method properly handles exceptions thrown by
-	playwright_browser.close() and playwright.stop(), ensuring that the
-	browser's attributes are set to None even if errors occur.
+	Test that a caller resuming from a failed init does not drop the init task another caller
+	already started as a retry, so the browser is not launched a third time.
 	"""
+	playwright, factory = mock_async_playwright()
+	dummy_browser = AsyncMock()
+	first_attempt = asyncio.Event()
+	retry_started = asyncio.Event()
+	release_retry = asyncio.Event()
+
+	async def launch(**kwargs):
+		if not first_attempt.is_set():
+			first_attempt.set()
+			await asyncio.sleep(0)
+			raise Exception('Launch error simulation')
+		retry_started.set()
+		await release_retry.wait()
+		return dummy_browser
+
+	playwright.chromium.launch = AsyncMock(side_effect=launch)
+	patch_playwright(factory)
+	browser_obj = Browser(config=BrowserConfig(headless=True))
+
+	async def get_with_retry():
+		try:
+			return await browser_obj.get_playwright_browser()
+		except Exception:
+			return await browser_obj.get_playwright_browser()
+
+	retrying = asyncio.create_task(get_with_retry())
+	await first_attempt.wait()
+	with pytest.raises(Exception, match='Launch error simulation'):
+		await browser_obj.get_playwright_browser()
+	await retry_started.wait()
+	assert browser_obj._init_task is not None
+	waiting = asyncio.create_task(browser_obj.get_playwright_browser())
+	release_retry.set()
+	assert await asyncio.gather(retrying, waiting) == [dummy_browser, dummy_browser]
+	assert playwright.chromium.launch.await_count == 2
+	await browser_obj.close()
 
-	class DummyBrowserWithError:
-		async def close(self):
-			raise Exception('Close error simulation')
 
-	class DummyPlaywrightWithError:
-		async def stop(self):
-			raise Exception('Stop error simulation')
+async def test_close_error_handling():
+	"""
+	Test that the close method properly handles exceptions thrown by
+	playwright_browser.close() and playwright.stop(), ensuring that both are still
+	attempted and the browser's attributes are set to None even if errors occur.
+	"""
+	playwright_browser = MagicMock(close=AsyncMock(side_effect=Exception('Close error simulation')))
+	playwright = MagicMock(stop=AsyncMock(side_effect=Exception('Stop error simulation')))
 
 	config = BrowserConfig()
 	browser_obj = Browser(config=config)
-	browser_obj.playwright_browser = DummyBrowserWithError()
-	browser_obj.playwright = DummyPlaywrightWithError()
+	browser_obj.playwright_browser = playwright_browser
+	browser_obj.playwright = playwright
 	await browser_obj.close()
+	playwright_browser.close.assert_awaited_once()
+	playwright.stop.assert_awaited_once()
 	assert browser_obj.playwright_browser is None, 'Expected playwright_browser to be None after close'
 	assert browser_obj.playwright is None, 'Expected playwright to be None after close'
 
 
-@pytest.mark.asyncio
-async def test_standard_browser_launch_with_proxy(monkeypatch):
+async def test_close_closes_browser_before_stopping_playwright():
 	"""
-	Test that when a proxy is provided in the BrowserConfig, the _setup_builtin_browser method
-	correctly passes the proxy parameter to the playwright.chromium.launch method.
-	This test sets up a dummy async_playwright context and verifies that the dummy proxy is received.
+	Test that close() waits for playwright_browser.close() to finish before calling playwright.stop(),
+	since stopping the driver first would kill chrome in the middle of closing.
 	"""
+	calls = []
 
-	class DummyBrowser:
-		pass
+	async def close_browser():
+		await asyncio.sleep(0)
+		calls.append('close')
 
-	# Create a dummy proxy settings instance.
-	dummy_proxy = ProxySettings(server='http://dummy.proxy')
+	async def stop_playwright():
+		calls.append('stop')
 
-	class DummyChromium:
-		async def launch(self, headless, args, proxy=None, handle_sigterm=False, handle_sigint=False):
-			# Assert that the proxy passed equals the dummy proxy provided in the configuration.
-			assert isinstance(proxy, dict) and proxy['server'] == 'http://dummy.proxy', (
-				f'Expected proxy {dummy_proxy} but got {proxy}'
-			)
-			# We can also verify some base parameters if needed (headless, args) but our focus is proxy.
-			return DummyBrowser()
+	browser_obj = Browser(config=BrowserConfig())
+	browser_obj.playwright_browser = MagicMock(close=AsyncMock(side_effect=close_browser))
+	browser_obj.playwright = MagicMock(stop=AsyncMock(side_effect=stop_playwright))
+	await browser_obj.close()
+	assert calls == ['close', 'stop']
 
-	class DummyPlaywright:
-		def __init__(self):
-			self.chromium = DummyChromium()
 
-		async def stop(self):
-			pass
-
-	class DummyAsyncPlaywrightContext:
-		async def start(self):
-			return DummyPlaywright()
+async def test_standard_browser_launch_with_proxy(patch_playwright):
+	"""
+	Test that when a proxy is provided in the BrowserConfig, the _setup_builtin_browser method
+	correctly passes the proxy parameter to the playwright.chromium.launch method.
+	This test mocks async_playwright and verifies that the dummy proxy is received.
+	"""
+	# Create a dummy proxy settings instance.
+	dummy_proxy = ProxySettings(server='http://dummy.proxy')
 
-	# Monkeypatch async_playwright to return our dummy async playwright context.
-	monkeypatch.setattr('browser_use.browser.browser.async_playwright', lambda: DummyAsyncPlaywrightContext())
+	dummy_browser = AsyncMock()
+	playwright, factory = mock_async_playwright(dummy_browser)
+	patch_playwright(factory)
 	# Create a BrowserConfig with the dummy proxy.
 	config = BrowserConfig(headless=False, disable_security=False, proxy=dummy_proxy)
 	browser_obj = Browser(config=config)
 	# Call get_playwright_browser and verify that the returned browser is as expected.
 	result_browser = await browser_obj.get_playwright_browser()
-	assert isinstance(result_browser, DummyBrowser), 'Expected DummyBrowser from _setup_builtin_browser with proxy provided'
+	assert result_browser is dummy_browser, 'Expected the mocked browser from _setup_builtin_browser with proxy provided'
+	# Assert that the proxy passed equals the dummy proxy provided in the configuration.
+	proxy = playwright.chromium.launch.call_args.kwargs['proxy']
+	assert isinstance(proxy, dict) and proxy['server'] == 'http://dummy.proxy', f'Expected proxy {dummy_proxy} but got {proxy}'
 	await browser_obj.close()
 
 
-@pytest.mark.asyncio
-async def test_browser_window_size(monkeypatch):
+async def test_browser_window_size(patch_playwright):
 	"""
 	Test that when a browser_window_size is provided in BrowserContextConfig,
 	it's properly converted to a dictionary when passed to Playwright.
@@ -463,22 +455,9 @@ async def test_browser_window_size(monkeypatch):
 		async def close(self):
 			pass
 
-	class DummyPlaywright:
-		def __init__(self):
-			self.chromium = self
-
-		async def launch(self, **kwargs):
-			return DummyBrowser()
-
-		async def stop(self):
-			pass
-
-	class DummyAsyncPlaywrightContext:
-		async def start(self):
-			return DummyPlaywright()
-
-	# Monkeypatch async_playwright to return our dummy async playwright context
-	monkeypatch.setattr('browser_use.browser.browser.async_playwright', lambda: DummyAsyncPlaywrightContext())
+	# Mock async_playwright so start() hands back one shared playwright that launches our dummy browser
+	_, factory = mock_async_playwright(DummyBrowser())
+	patch_playwright(factory)
 
 	# Create browser with default config
 	browser_obj = Browser()
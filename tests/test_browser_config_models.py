@@ -6,7 +6,6 @@ from browser_use.browser.browser import Browser, BrowserConfig, ProxySettings
 from browser_use.browser.context import BrowserContext, BrowserContextConfig, BrowserContextWindowSize
 
 
-@pytest.mark.asyncio
 async def test_proxy_settings_pydantic_model():
 	"""
 	Test that ProxySettings as a Pydantic model is correctly converted to a dictionary when used.
@@ -32,7 +31,6 @@ async def test_proxy_settings_pydantic_model():
 	# We don't launch the actual browser - we just verify the model itself works as expected
 
 
-@pytest.mark.asyncio
 async def test_window_size_pydantic_model():
 	"""
 	Test that BrowserContextWindowSize as a Pydantic model is correctly converted to a dictionary when used.
@@ -62,7 +60,6 @@ async def test_window_size_pydantic_model():
 	assert config2.browser_window_size.height == 1080
 
 
-@pytest.mark.asyncio
 @pytest.mark.skipif(os.environ.get('CI') == 'true', reason='Skip browser test in CI')
 async def test_window_size_with_real_browser():
 	"""
@@ -153,7 +150,6 @@ async def test_window_size_with_real_browser():
 		await browser.close()
 
 
-@pytest.mark.asyncio
 async def test_proxy_with_real_browser():
 	"""
 	Integration test that verifies our proxy Pydantic model is correctly
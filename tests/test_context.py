@@ -1,9 +1,11 @@
+import asyncio
 import base64
-from unittest.mock import Mock
+import json
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
-from browser_use.browser.context import BrowserContext, BrowserContextConfig
+from browser_use.browser.context import BrowserContext, BrowserContextConfig, _is_domain_in_allowed_domains
 from browser_use.browser.views import BrowserState
 from browser_use.dom.views import DOMElementNode
 
@@ -39,11 +41,31 @@ def test_is_url_allowed():
 	assert context2._is_url_allowed('https://mysite.org/page') is True
 	# URL with port number, still allowed (port is stripped)
 	assert context2._is_url_allowed('http://example.com:8080') is True
+	# Nested subdomains and mixed case hostnames are allowed
+	assert context2._is_url_allowed('https://a.b.EXAMPLE.com/') is True
+	# Allowed domain only appearing as a subdomain label of another domain is not allowed
+	assert context2._is_url_allowed('http://example.com.evil.org') is False
 	# Scenario 3: Malformed URL or empty domain
 	# urlparse will return an empty netloc for some malformed URLs.
 	assert context2._is_url_allowed('notaurl') is False
 
 
+def test_is_url_allowed_caches_on_hostname():
+	"""
+	Test that the allowlist cache is keyed on the hostname, so urls only differing in path, query or fragment
+	share one cache entry and data: urls are never cached.
+	"""
+	dummy_browser = Mock()
+	dummy_browser.config = Mock()
+	context = BrowserContext(browser=dummy_browser, config=BrowserContextConfig(allowed_domains=['cache-test.com']))
+	_is_domain_in_allowed_domains.cache_clear()
+	assert context._is_url_allowed('https://cache-test.com/search?q=1') is True
+	assert context._is_url_allowed('https://cache-test.com/search?q=2#results') is True
+	assert context._is_url_allowed('data:text/html,' + 'a' * 1000) is False
+	cache_info = _is_domain_in_allowed_domains.cache_info()
+	assert (cache_info.hits, cache_info.misses, cache_info.currsize) == (1, 1, 1)
+
+
 def test_convert_simple_xpath_to_css_selector():
 	"""
 	Test the _convert_simple_xpath_to_css_selector method of BrowserContext.
@@ -95,7 +117,6 @@ def test_get_initial_state():
 	assert state_without_page.url == ''
 
 
-@pytest.mark.asyncio
 async def test_execute_javascript():
 	"""
 	Test the execute_javascript method by mocking the current page's evaluate function.
@@ -123,7 +144,6 @@ async def test_execute_javascript():
 	assert result == 'dummy_result'
 
 
-@pytest.mark.asyncio
 async def test_enhanced_css_selector_for_element():
 	"""
 	Test the _enhanced_css_selector_for_element method to verify that
@@ -158,7 +178,6 @@ async def test_enhanced_css_selector_for_element():
 	assert actual_selector == expected_selector, f'Expected {expected_selector}, but got {actual_selector}'
 
 
-@pytest.mark.asyncio
 async def test_get_scroll_info():
 	"""
 	Test the get_scroll_info method by mocking the page's evaluate method.
@@ -199,7 +218,6 @@ async def test_get_scroll_info():
 	assert pixels_below == 600, f'Expected 600 pixels below, got {pixels_below}'
 
 
-@pytest.mark.asyncio
 async def test_reset_context():
 	"""
 	Test the reset_context method to ensure it correctly closes all existing tabs,
@@ -264,7 +282,6 @@ async def test_reset_context():
 	assert state.element_tree.tag_name == 'root'
 
 
-@pytest.mark.asyncio
 async def test_take_screenshot():
 	"""
 	Test the take_screenshot method to verify that it returns a base64 encoded screenshot string.
@@ -296,7 +313,6 @@ async def test_take_screenshot():
 	assert result == expected, f'Expected {expected}, but got {result}'
 
 
-@pytest.mark.asyncio
 async def test_refresh_page_behavior():
 	"""
 	Test the refresh_page method of BrowserContext to verify that it correctly reloads the current page
@@ -333,7 +349,6 @@ async def test_refresh_page_behavior():
 	assert dummy_page.wait_for_load_state_called is True, 'Expected the page to call wait_for_load_state()'
 
 
-@pytest.mark.asyncio
 async def test_remove_highlights_failure():
 	"""
 	Test the remove_highlights method to ensure that if the page.evaluate call fails,
@@ -360,3 +375,192 @@ async def test_remove_highlights_failure():
 		await context.remove_highlights()
 	except Exception as e:
 		pytest.fail(f'remove_highlights raised an exception: {e}')
+
+
+async def test_is_file_uploader():
+	"""
+	Test the is_file_uploader method to verify that it finds a file input among the
+	element's descendants, but only down to max_depth levels below the element.
+	"""
+
+	def make_node(tag_name, attributes=None, children=None):
+		node = DOMElementNode(
+			tag_name=tag_name,
+			is_visible=True,
+			parent=None,
+			xpath=f'/{tag_name}',
+			attributes=attributes or {},
+			children=children or [],
+		)
+		for child in node.children:
+			child.parent = node
+		return node
+
+	dummy_browser = Mock()
+	dummy_browser.config = Mock()
+	context = BrowserContext(browser=dummy_browser, config=BrowserContextConfig())
+	# A file input two levels below the element is found.
+	file_input = make_node('input', {'type': 'file'})
+	assert await context.is_file_uploader(
+		make_node('div', children=[make_node('span'), make_node('label', children=[file_input])])
+	)
+	# An element without file inputs is not an uploader.
+	assert not await context.is_file_uploader(make_node('div', children=[make_node('input', {'type': 'text'})]))
+	# A file input deeper than max_depth is not found.
+	deep_tree = make_node('input', {'accept': 'image/*'})
+	for _ in range(4):
+		deep_tree = make_node('div', children=[deep_tree])
+	assert not await context.is_file_uploader(deep_tree)
+	assert await context.is_file_uploader(deep_tree, max_depth=4)
+
+
+async def test_get_session_lazy_initialization():
+	"""
+	Test that entering the context does not create a session, and that concurrent
+	get_session calls share a single _initialize_session call.
+	"""
+	dummy_browser = Mock()
+	dummy_browser.config = Mock()
+	context = BrowserContext(browser=dummy_browser, config=BrowserContextConfig())
+	dummy_session = Mock()
+
+	async def dummy_initialize_session():
+		await asyncio.sleep(0)
+		context.session = dummy_session
+		return dummy_session
+
+	context._initialize_session = AsyncMock(side_effect=dummy_initialize_session)
+	async with context:
+		context._initialize_session.assert_not_awaited()
+		sessions = await asyncio.gather(*(context.get_session() for _ in range(3)))
+		assert all(session is dummy_session for session in sessions)
+		context._initialize_session.assert_awaited_once()
+		context.session = None  # nothing to close, the session is a mock
+
+
+async def test_close_saves_cookies_and_stops_tracing(tmp_path):
+	"""
+	Test that close saves the cookies and stops tracing before closing the playwright context,
+	and that a tracing failure does not prevent the cookies from being saved or the context from closing.
+	"""
+	cookies_file = tmp_path / 'cookies.json'
+	dummy_browser = Mock()
+	dummy_browser.config = Mock()
+	config = BrowserContextConfig(cookies_file=str(cookies_file), trace_path=str(tmp_path))
+	context = BrowserContext(browser=dummy_browser, config=config)
+	playwright_context = Mock()
+	playwright_context.cookies = AsyncMock(return_value=[{'name': 'session', 'value': 'abc'}])
+	playwright_context.tracing.stop = AsyncMock(side_effect=Exception('Trace error simulation'))
+	playwright_context.close = AsyncMock()
+	context.session = Mock(context=playwright_context)
+	context._page_event_handler = None
+
+	await context.close()
+	assert json.loads(cookies_file.read_text()) == [{'name': 'session', 'value': 'abc'}]
+	playwright_context.tracing.stop.assert_awaited_once_with(path=str(tmp_path / f'{context.context_id}.zip'))
+	playwright_context.close.assert_awaited_once()
+	assert context.session is None
+
+
+async def test_close_waits_for_pending_session_init():
+	"""
+	Test that close() waits for an in-flight _initialize_session, so the context it creates is
+	closed instead of being attached to the BrowserContext after teardown.
+	"""
+	dummy_browser = Mock()
+	dummy_browser.config = Mock()
+	context = BrowserContext(browser=dummy_browser, config=BrowserContextConfig())
+	playwright_context = Mock()
+	playwright_context.cookies = AsyncMock(return_value=[])
+	playwright_context.close = AsyncMock()
+	context._page_event_handler = None
+	started = asyncio.Event()
+	release = asyncio.Event()
+
+	async def dummy_initialize_session():
+		started.set()
+		await release.wait()
+		context.session = Mock(context=playwright_context)
+		return context.session
+
+	context._initialize_session = AsyncMock(side_effect=dummy_initialize_session)
+	get_session = asyncio.create_task(context.get_session())
+	await started.wait()
+	close = asyncio.create_task(context.close())
+	await asyncio.sleep(0)
+	assert not close.done()
+	release.set()
+	await close
+	await get_session
+	playwright_context.close.assert_awaited_once()
+	assert context.session is None
+	assert context._session_init_task is None
+
+
+async def test_close_after_pending_session_init_was_cancelled():
+	"""
+	Test that close() treats a cancelled session init like a failed one and returns normally,
+	instead of passing the init's cancellation on to a caller that was never cancelled.
+	"""
+	dummy_browser = Mock()
+	dummy_browser.config = Mock()
+	context = BrowserContext(browser=dummy_browser, config=BrowserContextConfig())
+	context._page_event_handler = None
+	started = asyncio.Event()
+
+	async def dummy_initialize_session():
+		started.set()
+		await asyncio.Event().wait()
+
+	context._initialize_session = AsyncMock(side_effect=dummy_initialize_session)
+	get_session = asyncio.create_task(context.get_session())
+	await started.wait()
+	close = asyncio.create_task(context.close())
+	await asyncio.sleep(0)
+	context._session_init_task.cancel()
+	await close
+	assert not close.cancelled()
+	with pytest.raises(asyncio.CancelledError):
+		await get_session
+	assert context.session is None
+	assert context._session_init_task is None
+
+
+async def test_get_session_failed_waiter_keeps_retried_init():
+	"""
+	Test that a caller resuming from a failed session init does not drop the init task another
+	caller already started as a retry, so only one more session gets initialized.
+	"""
+	dummy_browser = Mock()
+	dummy_browser.config = Mock()
+	context = BrowserContext(browser=dummy_browser, config=BrowserContextConfig())
+	dummy_session = Mock()
+	first_attempt = asyncio.Event()
+	release_retry = asyncio.Event()
+
+	async def dummy_initialize_session():
+		if not first_attempt.is_set():
+			first_attempt.set()
+			await asyncio.sleep(0)
+			raise Exception('Init error simulation')
+		await release_retry.wait()
+		context.session = dummy_session
+		return dummy_session
+
+	context._initialize_session = AsyncMock(side_effect=dummy_initialize_session)
+
+	async def get_with_retry():
+		try:
+			return await context.get_session()
+		except Exception:
+			return await context.get_session()
+
+	retrying = asyncio.create_task(get_with_retry())
+	await first_attempt.wait()
+	with pytest.raises(Exception, match='Init error simulation'):
+		await context.get_session()
+	assert context._session_init_task is not None
+	waiting = asyncio.create_task(context.get_session())
+	release_retry.set()
+	assert await asyncio.gather(retrying, waiting) == [dummy_session, dummy_session]
+	assert context._initialize_session.await_count == 2
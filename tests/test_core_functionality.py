@@ -1,4 +1,3 @@
-import asyncio
 import os
 
 import pytest
@@ -11,15 +10,7 @@ from browser_use.browser.browser import Browser, BrowserConfig
 
 
 @pytest.fixture(scope='function')
-def event_loop():
-	"""Create an instance of the default event loop for each test case."""
-	loop = asyncio.get_event_loop_policy().new_event_loop()
-	yield loop
-	loop.close()
-
-
-@pytest.fixture(scope='function')
-async def browser(event_loop):
+async def browser():
 	browser_instance = Browser(
 		config=BrowserConfig(
 			headless=True,
@@ -47,7 +38,6 @@ def llm():
 
 
 # pytest -s -k test_search_google
-@pytest.mark.asyncio
 async def test_search_google(llm, context):
 	"""Test 'Search Google' action"""
 	agent = Agent(
@@ -60,7 +50,6 @@ async def test_search_google(llm, context):
 	assert 'search_google' in action_names
 
 
-@pytest.mark.asyncio
 async def test_go_to_url(llm, context):
 	"""Test 'Navigate to URL' action"""
 	agent = Agent(
@@ -73,7 +62,6 @@ async def test_go_to_url(llm, context):
 	assert 'go_to_url' in action_names
 
 
-@pytest.mark.asyncio
 async def test_go_back(llm, context):
 	"""Test 'Go back' action"""
 	agent = Agent(
@@ -87,7 +75,6 @@ async def test_go_back(llm, context):
 	assert 'go_back' in action_names
 
 
-@pytest.mark.asyncio
 async def test_click_element(llm, context):
 	"""Test 'Click element' action"""
 	agent = Agent(
@@ -101,7 +88,6 @@ async def test_click_element(llm, context):
 	assert 'click_element_by_index' in action_names
 
 
-@pytest.mark.asyncio
 async def test_input_text(llm, context):
 	"""Test 'Input text' action"""
 	agent = Agent(
@@ -115,7 +101,6 @@ async def test_input_text(llm, context):
 	assert 'input_text' in action_names
 
 
-@pytest.mark.asyncio
 async def test_switch_tab(llm, context):
 	"""Test 'Switch tab' action"""
 	agent = Agent(
@@ -130,7 +115,6 @@ async def test_switch_tab(llm, context):
 	assert 'switch_tab' in action_names
 
 
-@pytest.mark.asyncio
 async def test_open_new_tab(llm, context):
 	"""Test 'Open new tab' action"""
 	agent = Agent(
@@ -143,7 +127,6 @@ async def test_open_new_tab(llm, context):
 	assert 'open_tab' in action_names
 
 
-@pytest.mark.asyncio
 async def test_extract_page_content(llm, context):
 	"""Test 'Extract page content' action"""
 	agent = Agent(
@@ -158,7 +141,6 @@ async def test_extract_page_content(llm, context):
 
 
 # pytest -k test_done_action
-@pytest.mark.asyncio
 async def test_done_action(llm, context):
 	"""Test 'Complete task' action"""
 	agent = Agent(
@@ -174,7 +156,6 @@ async def test_done_action(llm, context):
 
 
 # run with: pytest -k test_scroll_down
-@pytest.mark.asyncio
 async def test_scroll_down(llm, context):
 	"""Test 'Scroll down' action and validate that the page actually scrolled"""
 	agent = Agent(
@@ -8,7 +8,6 @@ from browser_use.agent.service import Agent
 from browser_use.agent.views import AgentHistoryList
 
 
-@pytest.mark.asyncio
 async def test_dropdown(llm, browser_context):
 	"""Test selecting an option from a dropdown menu."""
 	agent = Agent(
@@ -1,4 +1,3 @@
-import asyncio
 import os
 
 import pytest
@@ -15,15 +14,7 @@ from browser_use.controller.service import Controller
 
 
 @pytest.fixture(scope='session')
-def event_loop():
-	"""Create an instance of the default event loop for each test case."""
-	loop = asyncio.get_event_loop_policy().new_event_loop()
-	yield loop
-	loop.close()
-
-
-@pytest.fixture(scope='session')
-async def browser(event_loop):
+async def browser():
 	browser_instance = Browser(
 		config=BrowserConfig(
 			headless=True,
@@ -51,7 +42,6 @@ def llm():
 
 
 # pytest tests/test_excluded_actions.py -v -k "test_only_open_tab_allowed" --capture=no
-@pytest.mark.asyncio
 async def test_only_open_tab_allowed(llm, context):
 	"""Test that only open_tab action is available while others are excluded"""
 
@@ -0,0 +1,70 @@
+from typing import Optional
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from pydantic import BaseModel
+
+from browser_use.agent.message_manager.utils import save_conversation
+
+
+class DummyResponse(BaseModel):
+	thought: str
+	actions: list[dict]
+	memory: Optional[str] = None
+
+
+async def test_save_conversation(tmp_path):
+	"""
+	Test that save_conversation creates missing folders and writes every message followed by the
+	response, with list content reduced to its text parts, JSON strings pretty printed, plain strings
+	stripped and unset response fields left out.
+	"""
+	target = tmp_path / 'logs' / 'conversation_1.txt'
+	input_messages = [
+		SystemMessage(content='  You are a browser agent.  '),
+		HumanMessage(
+			content=[
+				{'type': 'text', 'text': ' Current url: https://example.com '},
+				{'type': 'image_url', 'image_url': {'url': 'data:image/png;base64,AAAA'}},
+				{'type': 'text', 'text': 'Interactive elements: [0]<button>Search</button>'},
+			]
+		),
+		AIMessage(content='{"current_state": {"next_goal": "search"}, "action": [{"click_element": {"index": 0}}]}'),
+	]
+	response = DummyResponse(thought='done', actions=[{'done': {'text': 'finished'}}])
+
+	await save_conversation(input_messages, response, str(target), encoding='utf-8')
+
+	assert target.read_text(encoding='utf-8') == (
+		' SystemMessage \n'
+		'You are a browser agent.\n'
+		'\n'
+		' HumanMessage \n'
+		'Current url: https://example.com\n'
+		'Interactive elements: [0]<button>Search</button>\n'
+		'\n'
+		' AIMessage \n'
+		'{\n'
+		'  "current_state": {\n'
+		'    "next_goal": "search"\n'
+		'  },\n'
+		'  "action": [\n'
+		'    {\n'
+		'      "click_element": {\n'
+		'        "index": 0\n'
+		'      }\n'
+		'    }\n'
+		'  ]\n'
+		'}\n'
+		'\n'
+		' RESPONSE\n'
+		'{\n'
+		'  "thought": "done",\n'
+		'  "actions": [\n'
+		'    {\n'
+		'      "done": {\n'
+		'        "text": "finished"\n'
+		'      }\n'
+		'    }\n'
+		'  ]\n'
+		'}'
+	)
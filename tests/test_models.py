@@ -1,4 +1,3 @@
-import asyncio
 import os
 
 import httpx
@@ -15,15 +14,7 @@ from browser_use.browser.browser import Browser, BrowserConfig
 
 
 @pytest.fixture(scope='function')
-def event_loop():
-	"""Create an instance of the default event loop for each test case."""
-	loop = asyncio.get_event_loop_policy().new_event_loop()
-	yield loop
-	loop.close()
-
-
-@pytest.fixture(scope='function')
-async def browser(event_loop):
+async def browser():
 	browser_instance = Browser(
 		config=BrowserConfig(
 			headless=True,
@@ -105,7 +96,6 @@ async def llm(request):
 	return request.param
 
 
-@pytest.mark.asyncio
 async def test_model_search(llm, context):
 	"""Test 'Search Google' action"""
 	model_name = llm.model if hasattr(llm, 'model') else llm.model_name
@@ -1,5 +1,3 @@
-import asyncio
-
 import pytest
 from langchain_ollama import ChatOllama
 
@@ -21,15 +19,7 @@ def llm():
 
 
 @pytest.fixture(scope='session')
-def event_loop():
-	"""Create an instance of the default event loop for each test case."""
-	loop = asyncio.get_event_loop_policy().new_event_loop()
-	yield loop
-	loop.close()
-
-
-@pytest.fixture(scope='session')
-async def browser(event_loop):
+async def browser():
 	browser_instance = Browser(
 		config=BrowserConfig(
 			headless=True,
@@ -1,4 +1,3 @@
-import asyncio
 import os
 
 import pytest
@@ -12,14 +11,7 @@ from browser_use.controller.service import Controller
 
 
 @pytest.fixture(scope='session')
-def event_loop():
-	loop = asyncio.get_event_loop_policy().new_event_loop()
-	yield loop
-	loop.close()
-
-
-@pytest.fixture(scope='session')
-async def browser(event_loop):
+async def browser():
 	browser_instance = Browser(
 		config=BrowserConfig(
 			headless=True,
@@ -101,7 +93,6 @@ def llm():
 
 
 # @pytest.mark.skip(reason="Skipping test for now")
-@pytest.mark.asyncio
 async def test_self_registered_actions_no_pydantic(llm, controller):
 	"""Test self-registered actions with individual arguments"""
 	agent = Agent(
@@ -119,7 +110,6 @@ async def test_self_registered_actions_no_pydantic(llm, controller):
 
 
 # @pytest.mark.skip(reason="Skipping test for now")
-@pytest.mark.asyncio
 async def test_mixed_arguments_actions(llm, controller):
 	"""Test actions with mixed argument types"""
 
@@ -150,7 +140,6 @@ async def test_mixed_arguments_actions(llm, controller):
 		pytest.fail(f'{correct} not found in extracted content')
 
 
-@pytest.mark.asyncio
 async def test_pydantic_simple_model(llm, controller):
 	"""Test action with a simple Pydantic model argument"""
 	agent = Agent(
@@ -172,7 +161,6 @@ async def test_pydantic_simple_model(llm, controller):
 		pytest.fail(f'{correct} not found in extracted content')
 
 
-@pytest.mark.asyncio
 async def test_pydantic_nested_model(llm, controller):
 	"""Test action with a nested Pydantic model argument"""
 	agent = Agent(
@@ -80,7 +80,6 @@ class TestAgent:
 		assert 'test_action' in call_args
 		assert call_args['test_action'] == mock_controller.registry.registry.actions['test_action'].param_model.return_value  # type: ignore
 
-	@pytest.mark.asyncio
 	async def test_step_error_handling(self):
 		"""
 		Test the error handling in the step method of the Agent class.
@@ -159,7 +158,6 @@ class TestRegistry:
 		# Assert that the included action was added to the registry
 		assert 'included_action' in registry_with_excludes.registry.actions
 
-	@pytest.mark.asyncio
 	async def test_execute_action_with_and_without_browser_context(self):
 		"""
 		Test that the execute_action method correctly handles actions with and without a browser context.
@@ -1,4 +1,3 @@
-import asyncio
 import os
 import random
 import string
@@ -14,14 +13,7 @@ from browser_use.controller.service import Controller
 
 
 @pytest.fixture(scope='session')
-def event_loop():
-	loop = asyncio.get_event_loop_policy().new_event_loop()
-	yield loop
-	loop.close()
-
-
-@pytest.fixture(scope='session')
-async def browser(event_loop):
+async def browser():
 	browser_instance = Browser(
 		config=BrowserConfig(
 			headless=True,
@@ -67,7 +59,6 @@ async def controller():
 	yield controller
 
 
-@pytest.mark.asyncio
 async def test_token_limit_with_multiple_extractions(llm, controller, context):
 	"""Test handling of multiple smaller extractions accumulating tokens"""
 	agent = Agent(
@@ -90,7 +81,6 @@ async def test_token_limit_with_multiple_extractions(llm, controller, context):
 
 @pytest.mark.slow
 @pytest.mark.parametrize('max_tokens', [4000])  # 8000 20000
-@pytest.mark.asyncio
 async def test_open_3_tabs_and_extract_content(llm, controller, context, max_tokens):
 	"""Stress test: Open 3 tabs with urls and extract content"""
 	agent = Agent(